@@ -26,86 +26,101 @@ function parseCSVLine(line) {
 function convertCSVToJSON() {
     const csvPath = path.join(__dirname, 'buildings_all.csv');
     const jsonPath = path.join(__dirname, 'buildings-data.json');
+    const prettyJsonPath = path.join(__dirname, 'buildings-data.pretty.json');
+    const pretty = process.argv.includes('--pretty');
+    const force = process.argv.includes('--force');
+
+    // Skip the conversion when the JSON is already newer than the CSV
+    if (!force && !pretty) {
+        const csvMtime = fs.statSync(csvPath).mtimeMs;
+        const jsonMtime = fs.existsSync(jsonPath) ? fs.statSync(jsonPath).mtimeMs : 0;
+        if (jsonMtime >= csvMtime) {
+            console.log(`⏭️  buildings-data.json is up to date (use --force to rebuild)`);
+            return;
+        }
+    }
 
     const csvContent = fs.readFileSync(csvPath, 'utf8');
-    const lines = csvContent.split('\n').filter(line => line.trim());
+    const lines = csvContent.split('\n');
 
-    // Parse header
-    const headers = parseCSVLine(lines[0]);
+    // Parse header (first non-blank line)
+    let lineIndex = 0;
+    while (lineIndex < lines.length && !lines[lineIndex].trim()) lineIndex++;
+    const headers = parseCSVLine(lines[lineIndex]);
+
+    // Resolve column positions once so rows can be read by index
+    const col = {};
+    headers.forEach((header, index) => {
+        if (header) col[header] = index;
+    });
 
     const buildingsByCategory = {};
     const categoryCounts = {};
 
-    // Parse each building row
-    for (let i = 1; i < lines.length; i++) {
+    // Parse each building row in a single pass, skipping blank lines inline
+    for (let i = lineIndex + 1; i < lines.length; i++) {
+        if (!lines[i].trim()) continue;
         const values = parseCSVLine(lines[i]);
 
         if (values.length < headers.length - 1) continue; // Skip incomplete rows
 
-        const building = {};
-        headers.forEach((header, index) => {
-            if (header && values[index] !== undefined) {
-                building[header] = values[index];
-            }
-        });
-
         // Convert to proper format
         const buildingData = {
-            id: building.id,
-            name: building.name,
-            category: building.category,
-            description: building.description || '',
-            graphicsFile: building.graphicsFile || '',
-            isDefault: building.isDefault === 'TRUE',
-            civicScore: parseFloat(building.civicScore) || 0,
+            id: values[col.id],
+            name: values[col.name],
+            category: values[col.category],
+            description: values[col.description] || '',
+            graphicsFile: values[col.graphicsFile] || '',
+            isDefault: values[col.isDefault] === 'TRUE',
+            civicScore: parseFloat(values[col.civicScore]) || 0,
             economics: {
-                buildCost: parseInt(building.buildCost) || 0,
-                constructionDays: parseInt(building.constructionDays) || 0,
-                maxRevenue: parseInt(building.maxRevenue) || 0,
-                maintenanceCost: parseInt(building.maintenanceCost) || 0,
-                decayRate: parseFloat(building.decayRate) || 0
+                buildCost: parseInt(values[col.buildCost]) || 0,
+                constructionDays: parseInt(values[col.constructionDays]) || 0,
+                maxRevenue: parseInt(values[col.maxRevenue]) || 0,
+                maintenanceCost: parseInt(values[col.maintenanceCost]) || 0,
+                decayRate: parseFloat(values[col.decayRate]) || 0
             },
             resources: {
-                jobsProvided: parseInt(building.jobsProvided) || 0,
-                energyProvided: parseInt(building.energyProvided) || 0,
-                energyRequired: parseInt(building.energyRequired) || 0,
-                educationProvided: parseInt(building.educationProvided) || 0,
-                foodProvided: parseInt(building.foodProvided) || 0,
-                housingProvided: parseInt(building.housingProvided) || 0,
-                healthcareProvided: parseInt(building.healthcareProvided) || 0
+                jobsProvided: parseInt(values[col.jobsProvided]) || 0,
+                energyProvided: parseInt(values[col.energyProvided]) || 0,
+                energyRequired: parseInt(values[col.energyRequired]) || 0,
+                educationProvided: parseInt(values[col.educationProvided]) || 0,
+                foodProvided: parseInt(values[col.foodProvided]) || 0,
+                housingProvided: parseInt(values[col.housingProvided]) || 0,
+                healthcareProvided: parseInt(values[col.healthcareProvided]) || 0
             },
             livability: {
                 culture: {
-                    impact: parseInt(building.culture_impact) || 0,
-                    attenuation: parseInt(building.culture_attenuation) || 0
+                    impact: parseInt(values[col.culture_impact]) || 0,
+                    attenuation: parseInt(values[col.culture_attenuation]) || 0
                 },
                 affordability: {
-                    impact: parseInt(building.affordability_impact) || 0,
-                    attenuation: parseInt(building.affordability_attenuation) || 0
+                    impact: parseInt(values[col.affordability_impact]) || 0,
+                    attenuation: parseInt(values[col.affordability_attenuation]) || 0
                 },
                 resilience: {
-                    impact: parseInt(building.resilience_impact) || 0,
-                    attenuation: parseInt(building.resilience_attenuation) || 0
+                    impact: parseInt(values[col.resilience_impact]) || 0,
+                    attenuation: parseInt(values[col.resilience_attenuation]) || 0
                 },
                 environment: {
-                    impact: parseInt(building.environment_impact) || 0,
-                    attenuation: parseInt(building.environment_attenuation) || 0
+                    impact: parseInt(values[col.environment_impact]) || 0,
+                    attenuation: parseInt(values[col.environment_attenuation]) || 0
                 },
                 noise: {
-                    impact: parseInt(building.noise_impact) || 0,
-                    attenuation: parseInt(building.noise_attenuation) || 0
+                    impact: parseInt(values[col.noise_impact]) || 0,
+                    attenuation: parseInt(values[col.noise_attenuation]) || 0
                 },
                 safety: {
-                    impact: parseInt(building.safety_impact) || 0,
-                    attenuation: parseInt(building.safety_attenuation) || 0
+                    impact: parseInt(values[col.safety_impact]) || 0,
+                    attenuation: parseInt(values[col.safety_attenuation]) || 0
                 }
             },
             graphics: {
-                default: building.graphicsFile || ''
+                default: values[col.graphicsFile] || ''
             },
             images: {
-                thumbnail: building.graphicsFile || '',
-                icon: building.graphicsFile || ''
+                thumbnail: values[col.graphicsFile] || '',
+                icon: values[col.graphicsFile] || ''
             }
         };
 
@@ -120,13 +135,19 @@ function convertCSVToJSON() {
         categoryCounts[category] = (categoryCounts[category] || 0) + 1;
     }
 
-    // Write JSON file with grouped format
-    fs.writeFileSync(jsonPath, JSON.stringify(buildingsByCategory, null, 2), 'utf8');
+    // Write compact JSON for the game to load; indented copy only on request (--pretty)
+    fs.writeFileSync(jsonPath, JSON.stringify(buildingsByCategory), 'utf8');
+    if (pretty) {
+        fs.writeFileSync(prettyJsonPath, JSON.stringify(buildingsByCategory, null, 2), 'utf8');
+    }
 
     // Calculate total buildings
     const totalBuildings = Object.values(buildingsByCategory).reduce((sum, arr) => sum + arr.length, 0);
 
     console.log(`✅ Successfully created buildings-data.json`);
+    if (pretty) {
+        console.log(`✅ Successfully created buildings-data.pretty.json`);
+    }
     console.log(`📊 Total buildings: ${totalBuildings}`);
     console.log(`📁 Categories breakdown:`);
     Object.entries(categoryCounts)
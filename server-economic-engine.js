@@ -4763,22 +4763,26 @@ class ServerEconomicEngine {
         let totalWealth = 0;
         let totalCivicContribution = 0;
         const playerCivicContributions = new Map();
+        const playerWealths = new Map();
+
+        // Sum CARENS-based building scores per owner in a single pass over buildings
+        // (instead of rescanning every building once per player)
+        const buildingCivicByOwner = new Map();
+        for (const [locationKey, building] of this.gameState.buildings) {
+            const buildingDef = this.buildingDefinitions.get(building.id);
+            if (buildingDef && buildingDef.civicScore !== undefined) {
+                buildingCivicByOwner.set(building.ownerId, (buildingCivicByOwner.get(building.ownerId) || 0) + buildingDef.civicScore);
+        // console.log(`[CIVIC] Player ${building.ownerId} building ${building.id} contributes ${buildingDef.civicScore} civic points`);
+            }
+        }
 
         for (const [playerId, playerState] of this.gameState.players) {
             const playerWealth = this.calculatePlayerWealth(playerId, this.getPlayerBalance(playerId));
+            playerWealths.set(playerId, playerWealth);
             totalWealth += playerWealth;
 
             // Calculate raw civic contribution (sum of CARENS-based building scores + infrastructure)
-            let civicContribution = 0;
-            for (const [locationKey, building] of this.gameState.buildings) {
-                if (building.ownerId !== playerId) continue;
-
-                const buildingDef = this.buildingDefinitions.get(building.id);
-                if (buildingDef && buildingDef.civicScore !== undefined) {
-                    civicContribution += buildingDef.civicScore;
-                    console.log(`[CIVIC] Player ${playerId} building ${building.id} contributes ${buildingDef.civicScore} civic points`);
-                }
-            }
+            let civicContribution = buildingCivicByOwner.get(playerId) || 0;
 
             // Add infrastructure civic score (power lines)
             const infraScore = this.calculateInfrastructureCivicScore(playerId);
@@ -4797,7 +4801,7 @@ class ServerEconomicEngine {
 
         // Calculate individual scores
         for (const [playerId, playerState] of this.gameState.players) {
-            const playerWealth = this.calculatePlayerWealth(playerId, this.getPlayerBalance(playerId));
+            const playerWealth = playerWealths.get(playerId); // Computed once in the first pass
             const lvtPaid = playerState.totalLVTPaid || 0;
             const publicFundingReceived = playerState.totalPublicFundingReceived || 0;
 